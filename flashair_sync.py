@@ -33,10 +33,12 @@ Configuration (.env file in the same directory as this script):
     LOCAL_SHOT_DIR=/run/flashair-shots  Tmpfs staging dir (avoids SD-card wear)
     REMOTE_SHOT_DIR=/path/to/shots      Destination on the remote server
 
-    # Managed by the script (do not edit)
-    LAST_SYNCED=                        Watermark — filename of last downloaded CSV
-    LAST_SCPD=                          Watermark — filename of last SCP'd CSV
-    LAST_SHOT_SCPD=                     Watermark — filename of last SCP'd BMP
+Watermarks are kept in .state.json next to this script (managed by the
+script; older installs' LAST_* values in .env are read until first updated):
+
+    LAST_SYNCED                         Filename of last downloaded CSV
+    LAST_SCPD                           Filename of last SCP'd CSV
+    LAST_SHOT_SCPD                      Filename of last SCP'd BMP
 
 Usage:
     python3 flashair_sync.py            # One-shot sync (for cron)
@@ -46,28 +48,50 @@ Usage:
 """
 
 import argparse
+import bisect
+import contextlib
 import fcntl
+import http.client
+import io
+import itertools
 import json
 import logging
 import os
+import shlex
+import shutil
 import signal
+import socket
 import subprocess
 import sys
+import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import urllib.error
-import urllib.request
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 log = logging.getLogger("flashair_sync")
 
+# Resolved once: .env, .state.json, .last_sync and .lock all live next to
+# this script, and resolve() is a realpath walk on every call.
+_SCRIPT_DIR = Path(__file__).resolve().parent
+
 FLASHAIR_DEFAULT_IP = "192.168.0.1"
 SCAN_WAIT_SECONDS = 5
 CONNECT_TIMEOUT = 30
 FLASHAIR_HTTP_TIMEOUT = 15
+FLASHAIR_PROBE_TIMEOUT = 2
+# wpa_supplicant control interface dir (ctrl_interface=DIR=... in
+# wpa_supplicant.conf); this is the Raspberry Pi OS / wpa_cli default.
+WPA_CTRL_DIR = "/var/run/wpa_supplicant"
+WPA_CTRL_TIMEOUT = 10
+RSYNC_IO_TIMEOUT = 60   # rsync --timeout: abort if no data moves for this long
+RSYNC_TIMEOUT = 300     # hard cap on a whole rsync batch
 DOWNLOAD_TIMEOUT = 120
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+DOWNLOAD_WORKERS = 4
 COOLDOWN_MINUTES_DEFAULT = 30
 POLL_SECONDS_DEFAULT = 60
 
@@ -85,16 +109,29 @@ FLASHAIR_STATUS_FILE = Path("/run/flashair-shots/heater-flashair.json")
 # .env helpers
 # ---------------------------------------------------------------------------
 
-def _env_path() -> Path:
-    return Path(__file__).resolve().parent / ".env"
+_ENV_PATH = _SCRIPT_DIR / ".env"
+
+
+# (mtime_ns, parsed) of the last .env read. A cycle consults .env several
+# times (config, cooldown, poll interval); re-parsing is only needed when
+# the file actually changed on disk.
+_env_cache: Optional[tuple[int, dict[str, str]]] = None
 
 
 def _read_env() -> dict[str, str]:
-    """Read .env file as key=value pairs (no shell expansion)."""
+    """Read .env file as key=value pairs (no shell expansion).
+
+    Cached on the file's mtime; returns a fresh copy so callers may mutate it.
+    """
+    global _env_cache
+    p = _ENV_PATH
+    try:
+        mtime = p.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    if _env_cache is not None and _env_cache[0] == mtime:
+        return dict(_env_cache[1])
     result: dict[str, str] = {}
-    p = _env_path()
-    if not p.exists():
-        return result
     for line in p.read_text().splitlines():
         line = line.strip()
         if not line or line.startswith("#"):
@@ -102,30 +139,61 @@ def _read_env() -> dict[str, str]:
         if "=" in line:
             k, v = line.split("=", 1)
             result[k.strip()] = v.strip()
-    return result
-
-
-def _write_env(data: dict[str, str]) -> None:
-    """Write the full .env dict back to disk, preserving comments and order."""
-    lines: list[str] = []
-    p = _env_path()
-    written: set[str] = set()
-    if p.exists():
-        for line in p.read_text().splitlines():
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#") and "=" in stripped:
-                k = stripped.split("=", 1)[0].strip()
-                if k in data:
-                    lines.append(f"{k}={data[k]}")
-                    written.add(k)
-                else:
-                    lines.append(line)
-            else:
-                lines.append(line)
-    for k, v in data.items():
-        if k not in written:
-            lines.append(f"{k}={v}")
-    p.write_text("\n".join(lines) + "\n")
+    _env_cache = (mtime, result)
+    return dict(result)
+
+
+# ---------------------------------------------------------------------------
+# State file (watermarks)
+# ---------------------------------------------------------------------------
+# Watermarks change every sync; .env is hand-edited config. Keeping the hot
+# state in its own tiny JSON file means a sync never rewrites the user's
+# .env (comments and all) on the Pi's SD card.
+
+_STATE_PATH = _SCRIPT_DIR / ".state.json"
+
+
+def _read_state() -> dict[str, str]:
+    """Read the state file. Missing or unreadable → empty."""
+    try:
+        state = json.loads(_STATE_PATH.read_text() or "{}")
+    except FileNotFoundError:
+        return {}
+    except ValueError as e:
+        log.warning(f"Ignoring corrupt {_STATE_PATH.name}: {e}")
+        return {}
+    if not isinstance(state, dict):
+        log.warning(f"Ignoring corrupt {_STATE_PATH.name}: not a JSON object")
+        return {}
+    return state
+
+
+def _load_state_value(key: str) -> str:
+    """Return state *key*. Installs that predate the state file kept
+    watermarks in .env, so fall back to that until the key is first saved."""
+    state = _read_state()
+    if key not in state:
+        return _read_env().get(key, "")
+    value = state[key]
+    if isinstance(value, str):
+        return value
+    # Hand edits: accept a bare number (FLASHAIR_NET_ID: 3), treat anything
+    # else (null, lists, ...) as unset rather than crash a comparison later.
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    log.warning(f"Ignoring non-string {key} in {_STATE_PATH.name}: {value!r}")
+    return ""
+
+
+def _save_state_value(key: str, value: str) -> None:
+    """Set state *key* via temp + rename (a crash can't truncate the file)."""
+    state = _read_state()
+    if state.get(key) == value:
+        return
+    state[key] = value
+    tmp = _STATE_PATH.with_suffix(_STATE_PATH.suffix + ".tmp")
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n")
+    os.replace(str(tmp), str(_STATE_PATH))
 
 
 # ---------------------------------------------------------------------------
@@ -221,13 +289,11 @@ def load_config() -> Config:
 # ---------------------------------------------------------------------------
 
 def load_last_synced() -> str:
-    return _read_env().get("LAST_SYNCED", "")
+    return _load_state_value("LAST_SYNCED")
 
 
 def save_last_synced(filename: str) -> None:
-    env = _read_env()
-    env["LAST_SYNCED"] = filename
-    _write_env(env)
+    _save_state_value("LAST_SYNCED", filename)
     log.info(f"Updated LAST_SYNCED={filename}")
 
 
@@ -235,7 +301,7 @@ def save_last_synced(filename: str) -> None:
 # Cooldown (skip FlashAir scan after a recent successful download)
 # ---------------------------------------------------------------------------
 
-_COOLDOWN_PATH = Path(__file__).resolve().parent / ".last_sync"
+_COOLDOWN_PATH = _SCRIPT_DIR / ".last_sync"
 
 
 def _cooldown_minutes() -> int:
@@ -247,18 +313,39 @@ def _cooldown_minutes() -> int:
         return COOLDOWN_MINUTES_DEFAULT
 
 
-def _in_cooldown() -> bool:
+# mtime of .last_sync: stat()ed once per cycle, then kept current by
+# _touch_cooldown(). 0.0 if the file doesn't exist; None until first read.
+_cooldown_mtime_cache: Optional[float] = None
+
+
+def _cooldown_mtime(refresh: bool = False) -> float:
+    """Return the mtime of the cooldown file (0.0 if none), from cache unless *refresh*."""
+    global _cooldown_mtime_cache
+    if refresh or _cooldown_mtime_cache is None:
+        try:
+            _cooldown_mtime_cache = os.stat(_COOLDOWN_PATH).st_mtime
+        except OSError:
+            _cooldown_mtime_cache = 0.0
+    return _cooldown_mtime_cache
+
+
+def _in_cooldown(refresh: bool = False) -> bool:
     """Return True if a successful download happened within the cooldown period."""
-    if not _COOLDOWN_PATH.exists():
+    mtime = _cooldown_mtime(refresh)
+    if not mtime:
         return False
-    minutes = _cooldown_minutes()
-    age_minutes = (time.time() - _COOLDOWN_PATH.stat().st_mtime) / 60
-    return age_minutes < minutes
+    age_minutes = (time.time() - mtime) / 60
+    return age_minutes < _cooldown_minutes()
 
 
 def _touch_cooldown() -> None:
     """Record that a successful download just happened."""
-    _COOLDOWN_PATH.touch()
+    global _cooldown_mtime_cache
+    try:
+        os.utime(_COOLDOWN_PATH, None)
+    except FileNotFoundError:
+        open(_COOLDOWN_PATH, "wb").close()
+    _cooldown_mtime_cache = time.time()
 
 
 # ---------------------------------------------------------------------------
@@ -285,9 +372,10 @@ def _poll_seconds() -> int:
 
 def _remaining_cooldown_seconds() -> float:
     """Return seconds left in the cooldown period (0 if not in cooldown)."""
-    if not _COOLDOWN_PATH.exists():
+    mtime = _cooldown_mtime()
+    if not mtime:
         return 0
-    age = time.time() - _COOLDOWN_PATH.stat().st_mtime
+    age = time.time() - mtime
     remaining = (_cooldown_minutes() * 60) - age
     return max(0, remaining)
 
@@ -306,10 +394,12 @@ def _interruptible_sleep(seconds: float) -> None:
 # without scraping the journal. The Pi running flashair-sync also runs the
 # remote-switch web UI as the Apache mod_wsgi process — both processes share
 # the filesystem, so a single tmpfs file is the cheapest "API" available.
-# Lock is kept as cheap insurance against re-entry from a future caller (only
-# one writer thread today).
+# _status_lock guards the dict; _status_write_lock serialises the temp +
+# rename in _write_status(), since download_files() updates status from
+# several worker threads at once.
 
 _status_lock = threading.Lock()
+_status_write_lock = threading.Lock()
 _status: dict = {
     # Pipeline stage (added 2026-05-21). Lets a glance-only consumer surface
     # *what* is happening, not just whether something is. Linear progression:
@@ -369,15 +459,18 @@ def _write_status() -> None:
     covers the WSGI process). Never raises — a tmpfs write failure should
     not crash the sync loop.
     """
-    snap = _status_snapshot()
-    try:
-        FLASHAIR_STATUS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        tmp = FLASHAIR_STATUS_FILE.with_suffix(FLASHAIR_STATUS_FILE.suffix + ".tmp")
-        tmp.write_text(json.dumps(snap))
-        os.chmod(str(tmp), 0o664)
-        os.replace(str(tmp), str(FLASHAIR_STATUS_FILE))
-    except OSError as e:
-        log.debug(f"Status file write failed: {e}")
+    tmp = FLASHAIR_STATUS_FILE.with_suffix(FLASHAIR_STATUS_FILE.suffix + ".tmp")
+    with _status_write_lock:
+        # Snapshot under the write lock too, so writes land in the order
+        # their snapshots were taken and a stale one can't win the rename.
+        snap = _status_snapshot()
+        try:
+            FLASHAIR_STATUS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(snap))
+            os.chmod(str(tmp), 0o664)
+            os.replace(str(tmp), str(FLASHAIR_STATUS_FILE))
+        except OSError as e:
+            log.debug(f"Status file write failed: {e}")
 
 
 def _sleep_with_heartbeat(total_secs: float, chunk_secs: int = 30) -> None:
@@ -467,13 +560,10 @@ def _status_init_from_disk() -> None:
     """Prime last_sync_epoch from .last_sync mtime so a daemon restart doesn't
     erase the 'last sync at X' signal. The file count from that pre-restart
     session isn't recoverable — left at 0 until the next sync completes."""
-    if _COOLDOWN_PATH.exists():
-        try:
-            mtime = int(_COOLDOWN_PATH.stat().st_mtime)
-            with _status_lock:
-                _status["last_sync_epoch"] = mtime
-        except OSError:
-            pass
+    mtime = int(_cooldown_mtime())
+    if mtime:
+        with _status_lock:
+            _status["last_sync_epoch"] = mtime
 
 
 # ---------------------------------------------------------------------------
@@ -481,73 +571,238 @@ def _status_init_from_disk() -> None:
 # ---------------------------------------------------------------------------
 
 def acquire_lock() -> Optional[object]:
-    """Acquire an exclusive lock. Returns the file object, or None if locked."""
-    lock_path = Path(__file__).resolve().parent / ".lock"
-    f = open(lock_path, "w")
+    """Acquire an exclusive lock. Returns the file object, or None if locked.
+
+    O_CLOEXEC keeps the lock fd out of every child we spawn — notably the
+    backgrounded SSH ControlMaster, which outlives its scp batch and would
+    otherwise hold the lock past our exit. The file is only truncated once
+    we own the lock, so a losing contender no longer wipes the holder's PID.
+    """
+    lock_path = _SCRIPT_DIR / ".lock"
+    fd = os.open(lock_path, os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC, 0o644)
     try:
-        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
-        f.write(str(os.getpid()))
-        f.flush()
-        return f
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
     except OSError:
-        f.close()
+        os.close(fd)
         return None
+    os.ftruncate(fd, 0)
+    os.write(fd, f"{os.getpid()}\n".encode())
+    return os.fdopen(fd, "w")
 
 
 def release_lock(f) -> None:
-    """Release the exclusive lock."""
+    """Release the exclusive lock (closing the fd drops the flock)."""
     if f:
         try:
-            fcntl.flock(f, fcntl.LOCK_UN)
             f.close()
-        except Exception:
+        except OSError:
             pass
 
 
 # ---------------------------------------------------------------------------
-# WiFi management (wpa_cli)
+# WiFi management (wpa_supplicant control interface)
 # ---------------------------------------------------------------------------
 
-def _wpa_cli(interface: str, *args: str) -> subprocess.CompletedProcess:
-    """Run a wpa_cli command and return the result."""
-    cmd = ["wpa_cli", "-i", interface] + list(args)
-    return subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+def _backoff_delays(first: float = 0.2, cap: float = 1.0) -> Iterator[float]:
+    """Yield poll delays: *first*, doubling each time up to *cap*.
+
+    Association and DHCP usually finish within a couple of seconds, so a
+    fixed 1s poll wasted most of a second on the common fast path; backing
+    off keeps the slow path from spamming wpa_supplicant / the card.
+    """
+    delay = first
+    while True:
+        yield delay
+        delay = min(delay * 2, cap)
+
+
+class WpaCtrl:
+    """Persistent client for wpa_supplicant's control socket.
+
+    Speaks the same protocol as wpa_cli (UNIX datagram socket, one request
+    → one reply) but keeps one socket open for the whole cycle instead of
+    fork+exec'ing wpa_cli per command — a sync issues a dozen or more, at
+    ~20-40 ms apiece on a Pi Zero. Needs the same permissions as wpa_cli
+    (root or the netdev group).
+    """
+
+    _ids = itertools.count()
+
+    def __init__(self, interface: str, ctrl_dir: str = WPA_CTRL_DIR):
+        # wpa_supplicant replies to our bound address, so we need a path too.
+        self.local_path = os.path.join(
+            tempfile.gettempdir(),
+            f"flashair_wpa_{os.getpid()}-{next(self._ids)}",
+        )
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.local_path)  # left over from a recycled PID
+            self.sock.bind(self.local_path)
+            self.sock.connect(os.path.join(ctrl_dir, interface))
+            self.sock.settimeout(WPA_CTRL_TIMEOUT)
+        except OSError:
+            self.close()
+            raise
+
+    def request(self, command: str) -> bytes:
+        """Send *command* (e.g. "SCAN_RESULTS") and return the raw reply.
+
+        Left undecoded: callers inspect a line or two (or one field of a
+        multi-KB scan_results), so they compare bytes and decode only the
+        value they keep.
+        """
+        self.sock.send(command.encode())
+        while True:
+            reply = self.sock.recv(65536)
+            # Unsolicited "<N>EVENT" messages only arrive on ATTACHed
+            # sockets, but skip them like wpa_ctrl_request() does.
+            if not reply.startswith(b"<"):
+                return reply
+
+    def close(self) -> None:
+        self.sock.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.local_path)
+
+
+_wpa_clients: dict[str, WpaCtrl] = {}
+
+
+def _wpa_cli(interface: str, *args: str) -> bytes:
+    """Run a wpa_cli command over the control socket and return the reply.
+
+    Arguments are spelled as for wpa_cli ("set_network", "0", "ssid", ...).
+    If wpa_supplicant can't be reached the reply is b"", much like the empty
+    stdout of a failed wpa_cli run; the client is dropped so the next call
+    reconnects (and a late reply can't be mistaken for the next one).
+    """
+    command = " ".join((args[0].upper(),) + args[1:])
+    try:
+        client = _wpa_clients.get(interface)
+        if client is None:
+            client = _wpa_clients[interface] = WpaCtrl(interface)
+        return client.request(command)
+    except OSError as e:
+        log.warning(f"wpa_supplicant {args[0]} failed on {interface}: {e}")
+        _wpa_close(interface)
+        return b""
+
+
+def _wpa_close(interface: Optional[str] = None) -> None:
+    """Close the control-socket client for *interface* (or all of them)."""
+    for name in [interface] if interface else list(_wpa_clients):
+        client = _wpa_clients.pop(name, None)
+        if client is not None:
+            client.close()
 
 
 def get_current_ssid(interface: str) -> str:
     """Return the SSID of the currently connected WiFi network, or ''."""
-    result = _wpa_cli(interface, "status")
-    for line in result.stdout.splitlines():
-        if line.startswith("ssid="):
-            return line.split("=", 1)[1]
+    for line in _wpa_cli(interface, "status").splitlines():
+        if line.startswith(b"ssid="):
+            return line[5:].decode("utf-8", "replace")
     return ""
 
 
 def scan_for_ssid(interface: str, ssid: str) -> bool:
     """Trigger a WiFi scan and check if the given SSID is visible."""
-    result = _wpa_cli(interface, "scan")
-    if "FAIL" in result.stdout:
+    if b"FAIL" in _wpa_cli(interface, "scan"):
         log.warning("WiFi scan trigger failed")
         return False
 
     time.sleep(SCAN_WAIT_SECONDS)
 
     result = _wpa_cli(interface, "scan_results")
-    for line in result.stdout.splitlines()[1:]:  # Skip header row
-        parts = line.split("\t")
-        if len(parts) >= 5 and parts[4] == ssid:
-            log.info(f"FlashAir '{ssid}' detected (signal: {parts[2]} dBm)")
+    target = ssid.encode()
+    for line in result.splitlines()[1:]:  # Skip header row
+        parts = line.split(b"\t")
+        if len(parts) >= 5 and parts[4] == target:
+            log.info(f"FlashAir '{ssid}' detected (signal: {parts[2].decode()} dBm)")
             return True
     return False
 
 
-def connect_to_flashair(cfg: Config) -> int:
-    """Connect to the FlashAir WiFi network. Returns a wpa_cli network ID."""
+def _is_flashair_ssid(reply: bytes, ssid: str) -> bool:
+    """True if a GET_NETWORK <id> ssid *reply* is FLASHAIR_SSID.
+
+    wpa_supplicant quotes a printable SSID but answers with bare hex when it
+    has non-ASCII or non-printable bytes, so accept either encoding.
+    """
+    reply = reply.strip()
+    return reply in (f'"{ssid}"'.encode(), ssid.encode().hex().encode())
+
+
+def _saved_flashair_net_id(cfg: Config) -> Optional[int]:
+    """Return the network id of the saved FlashAir profile, if there is one.
+
+    Ids are renumbered whenever wpa_supplicant.conf is edited, so the id in
+    .state.json is only a hint: it's tried first, and if it no longer points
+    at FLASHAIR_SSID every configured network is checked by SSID.
+    """
+    iface = cfg.wifi_interface
+    hint = _load_state_value("FLASHAIR_NET_ID")
+    if hint.isdigit():
+        ssid = _wpa_cli(iface, "get_network", hint, "ssid")
+        if _is_flashair_ssid(ssid, cfg.flashair_ssid):
+            return int(hint)
+    # LIST_NETWORKS prints SSIDs escaped for display, so compare via
+    # GET_NETWORK instead; there are only a handful of networks.
+    for line in _wpa_cli(iface, "list_networks").splitlines()[1:]:
+        net_id = line.split(b"\t", 1)[0].decode()
+        if not net_id.isdigit() or net_id == hint:
+            continue
+        ssid = _wpa_cli(iface, "get_network", net_id, "ssid")
+        if _is_flashair_ssid(ssid, cfg.flashair_ssid):
+            log.info(f"Saved FlashAir network is now id {net_id}.")
+            _save_state_value("FLASHAIR_NET_ID", net_id)
+            return int(net_id)
+    if hint:
+        log.info(f"Saved FlashAir network {hint} is gone or changed; recreating.")
+    return None
+
+
+def _create_flashair_network(cfg: Config) -> int:
+    """Add the FlashAir profile and save it to wpa_supplicant.conf, disabled.
+
+    Saved disabled so wpa_supplicant never roams onto the card by itself;
+    select_network enables it just for a sync. Needs update_config=1 in
+    wpa_supplicant.conf — without it the profile stays in memory only and
+    reconnect_home's reconfigure drops it, i.e. the old per-run behaviour.
+    """
     iface = cfg.wifi_interface
+    # Start from exactly what's on disk, so save_config can't persist any
+    # in-memory state (e.g. networks disabled by an earlier select_network).
+    _wpa_cli(iface, "reconfigure")
     result = _wpa_cli(iface, "add_network")
-    net_id = int(result.stdout.strip().splitlines()[-1])
+    net_id = int(result.strip().splitlines()[-1])
     _wpa_cli(iface, "set_network", str(net_id), "ssid", f'"{cfg.flashair_ssid}"')
     _wpa_cli(iface, "set_network", str(net_id), "psk", f'"{cfg.flashair_password}"')
+    _wpa_cli(iface, "disable_network", str(net_id))
+    if _wpa_cli(iface, "save_config").strip() == b"OK":
+        _save_state_value("FLASHAIR_NET_ID", str(net_id))
+        log.info(f"Saved FlashAir network profile (id {net_id}).")
+    else:
+        log.warning(
+            "Could not save the FlashAir network profile "
+            "(update_config=1 missing?); using a temporary one."
+        )
+    return net_id
+
+
+def connect_to_flashair(cfg: Config) -> int:
+    """Connect to the FlashAir WiFi network. Returns a wpa_cli network ID.
+
+    Reuses the profile saved by _create_flashair_network() when there is
+    one. The psk can't be read back, so it's re-set in memory each time —
+    a changed FLASHAIR_PASSWORD still takes effect.
+    """
+    iface = cfg.wifi_interface
+    net_id = _saved_flashair_net_id(cfg)
+    if net_id is None:
+        net_id = _create_flashair_network(cfg)
+    else:
+        _wpa_cli(iface, "set_network", str(net_id), "psk", f'"{cfg.flashair_password}"')
     _wpa_cli(iface, "select_network", str(net_id))
     log.info(f"Connecting to {cfg.flashair_ssid}...")
     return net_id
@@ -556,66 +811,169 @@ def connect_to_flashair(cfg: Config) -> int:
 def reconnect_home(cfg: Config, net_id: Optional[int] = None) -> None:
     """Disconnect from FlashAir and reconnect to home WiFi."""
     iface = cfg.wifi_interface
+    # Pooled FlashAir connections are dead once we leave its network.
+    _http_close_all()
     if net_id is not None:
-        _wpa_cli(iface, "remove_network", str(net_id))
+        if str(net_id) == _load_state_value("FLASHAIR_NET_ID"):
+            # Keep the saved profile; reconfigure below restores it (and
+            # every network select_network disabled) from disk anyway.
+            _wpa_cli(iface, "disable_network", str(net_id))
+        else:
+            _wpa_cli(iface, "remove_network", str(net_id))
     _wpa_cli(iface, "reconfigure")
 
     log.info(f"Reconnecting to {cfg.home_ssid}...")
     deadline = time.time() + CONNECT_TIMEOUT
+    delays = _backoff_delays()
     while time.time() < deadline:
         if get_current_ssid(iface) == cfg.home_ssid:
             log.info(f"Connected to {cfg.home_ssid}")
             time.sleep(3)  # Allow DHCP to settle
             return
-        time.sleep(1)
+        time.sleep(next(delays))
 
     log.warning(f"Could not reconnect to {cfg.home_ssid} within {CONNECT_TIMEOUT}s")
 
 
 def wait_for_flashair(cfg: Config) -> bool:
     """Wait until the FlashAir HTTP server is reachable after connecting."""
-    url = f"http://{cfg.flashair_ip}/command.cgi?op=100&DIR=/"
     deadline = time.time() + CONNECT_TIMEOUT
+    delays = _backoff_delays()
     while time.time() < deadline:
         try:
-            with urllib.request.urlopen(url, timeout=5) as resp:
-                if resp.status == 200:
-                    log.info(f"FlashAir reachable at {cfg.flashair_ip}")
-                    return True
+            path = "/command.cgi?op=100&DIR=/"
+            with _flashair_get(cfg.flashair_ip, path, FLASHAIR_PROBE_TIMEOUT) as resp:
+                # Drain the body so the connection can be reused for the listing.
+                resp.read()
+            log.info(f"FlashAir reachable at {cfg.flashair_ip}")
+            return True
         except Exception:
             pass
-        time.sleep(1)
+        time.sleep(next(delays))
     log.error(f"FlashAir HTTP not reachable within {CONNECT_TIMEOUT}s")
     return False
 
 
+# ---------------------------------------------------------------------------
+# FlashAir HTTP connection pool
+# ---------------------------------------------------------------------------
+# urlopen() opens a fresh TCP connection per request and sends
+# `Connection: close`, so every listing and download paid a full handshake
+# over the slow FlashAir WiFi link. Instead, park a few idle keep-alive
+# http.client connections here and hand them out per request. If the card
+# answers with `Connection: close`, http.client transparently reconnects on
+# the next request, so this degrades to the old behaviour, never worse.
+
+FLASHAIR_HTTP_POOL_SIZE = 4
+
+_http_pool_lock = threading.Lock()
+_http_pool: list[tuple[str, http.client.HTTPConnection]] = []
+
+
+def _http_checkout(host: str, timeout: float) -> http.client.HTTPConnection:
+    """Take an idle connection to *host* from the pool, or open a new one."""
+    with _http_pool_lock:
+        for i, (pooled_host, conn) in enumerate(_http_pool):
+            if pooled_host == host:
+                del _http_pool[i]
+                break
+        else:
+            conn = None
+    if conn is None:
+        return http.client.HTTPConnection(host, timeout=timeout)
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn
+
+
+def _http_checkin(host: str, conn: http.client.HTTPConnection) -> None:
+    """Return a connection to the pool (or close it if the pool is full)."""
+    with _http_pool_lock:
+        if len(_http_pool) < FLASHAIR_HTTP_POOL_SIZE:
+            _http_pool.append((host, conn))
+            return
+    conn.close()
+
+
+def _http_close_all() -> None:
+    """Close every pooled connection (call after leaving the FlashAir network)."""
+    with _http_pool_lock:
+        conns = [conn for _host, conn in _http_pool]
+        _http_pool.clear()
+    for conn in conns:
+        conn.close()
+
+
+@contextlib.contextmanager
+def _flashair_get(host: str, path: str, timeout: float):
+    """GET http://host/path over a pooled keep-alive connection.
+
+    Yields the http.client.HTTPResponse. A non-200 status raises
+    urllib.error.HTTPError, same as urlopen() did. The connection goes back
+    to the pool only if the caller read the body to the end; otherwise it
+    is closed so the next user doesn't inherit a half-read response.
+    """
+    conn = _http_checkout(host, timeout)
+    reused = conn.sock is not None
+    ok = False
+    try:
+        try:
+            conn.request("GET", path, headers={"Connection": "keep-alive"})
+            resp = conn.getresponse()
+        except (http.client.HTTPException, ConnectionError):
+            if not reused:
+                raise
+            # The card dropped the idle connection — retry once on a fresh one.
+            conn.close()
+            conn.request("GET", path, headers={"Connection": "keep-alive"})
+            resp = conn.getresponse()
+        if resp.status != 200:
+            raise urllib.error.HTTPError(
+                f"http://{host}{path}", resp.status, resp.reason, resp.headers, None,
+            )
+        yield resp
+        ok = resp.isclosed()
+    finally:
+        if ok:
+            _http_checkin(host, conn)
+        else:
+            conn.close()
+
+
 # ---------------------------------------------------------------------------
 # FlashAir HTTP API
 # ---------------------------------------------------------------------------
 
-def list_flashair_files(ip: str, directory: str) -> list[str]:
+def list_flashair_files(ip: str, directory: str, after: str = "") -> list[str]:
     """List CSV files on the FlashAir matching the engine monitor pattern.
 
     Uses the FlashAir command.cgi op=100 directory listing API.
-    Returns a sorted list of filenames.
+    Returns a sorted list of filenames, only those sorting after *after*
+    if it is given.
     """
-    return sorted(list_flashair_files_with_sizes(ip, directory).keys())
+    return sorted(list_flashair_files_with_sizes(ip, directory, after).keys())
 
 
-def _parse_flashair_listing(content: str) -> dict[str, int]:
-    """Parse op=100 directory listing -> {filename: size_bytes}.
+def _parse_flashair_listing(
+    lines: Iterable[str], keep: Optional[Callable[[str], bool]] = None,
+) -> dict[str, int]:
+    """Parse op=100 directory listing lines -> {filename: size_bytes}.
 
     Output format per line: DIR,FILENAME,SIZE,ATTR,DATE,TIME
-    Caller filters by name.
+    Caller filters by name, either afterwards or by passing *keep*, which
+    drops unwanted lines before their size is even parsed.
     """
     out: dict[str, int] = {}
-    for line in content.splitlines():
+    for line in lines:
         if line.startswith("WLANSD_FILELIST"):
             continue
         parts = line.split(",")
         if len(parts) < 3:
             continue
         fname = parts[1].strip()
+        if keep is not None and not keep(fname):
+            continue
         try:
             out[fname] = int(parts[2].strip())
         except ValueError:
@@ -623,15 +981,40 @@ def _parse_flashair_listing(content: str) -> dict[str, int]:
     return out
 
 
-def list_flashair_files_with_sizes(ip: str, directory: str) -> dict[str, int]:
-    """List CSV files on FlashAir matching the engine-monitor pattern."""
-    url = f"http://{ip}/command.cgi?op=100&DIR={directory}"
-    with urllib.request.urlopen(url, timeout=FLASHAIR_HTTP_TIMEOUT) as resp:
-        content = resp.read().decode("utf-8")
-    return {
-        f: sz for f, sz in _parse_flashair_listing(content).items()
-        if f.startswith("log_") and f.lower().endswith(".csv")
-    }
+def _fetch_flashair_listing(
+    ip: str, directory: str, keep: Optional[Callable[[str], bool]] = None,
+) -> dict[str, int]:
+    """Fetch and parse the op=100 listing of *directory*.
+
+    Parsed line by line straight off the socket, so a listing of thousands
+    of files never sits in memory as one bytes blob, one str and a list of
+    lines — only the entries *keep* accepts are retained.
+    """
+    path = f"/command.cgi?op=100&DIR={directory}"
+    with _flashair_get(ip, path, FLASHAIR_HTTP_TIMEOUT) as resp:
+        return _parse_flashair_listing(io.TextIOWrapper(resp, encoding="utf-8"), keep)
+
+
+# FlashAir reports the name as stored on the card; in practice the
+# extension is one of these. A tuple endswith avoids a .lower() copy per
+# line of a listing that can run to thousands of files.
+_CSV_SUFFIXES = (".csv", ".CSV")
+
+
+def list_flashair_files_with_sizes(
+    ip: str, directory: str, after: str = "",
+) -> dict[str, int]:
+    """List CSV files on FlashAir matching the engine-monitor pattern.
+
+    op=100 has no server-side filter, so the card always sends the whole
+    directory. Passing the watermark as *after* at least drops every
+    already-synced name while parsing, so only the delta is kept — the
+    listing grows with the card, the delta usually doesn't.
+    """
+    def _keep(f: str) -> bool:
+        return f > after and f.startswith("log_") and f.endswith(_CSV_SUFFIXES)
+
+    return _fetch_flashair_listing(ip, directory, _keep)
 
 
 # How long to wait between size polls to confirm a file has stopped growing.
@@ -750,21 +1133,84 @@ def download_file(ip: str, directory: str, filename: str, local_dir: str) -> str
     """Download a single file from FlashAir via HTTP. Returns the local path."""
     dir_part = directory.strip("/")
     if dir_part:
-        url = f"http://{ip}/{dir_part}/{filename}"
+        path = f"/{dir_part}/{filename}"
     else:
-        url = f"http://{ip}/{filename}"
+        path = f"/{filename}"
 
     local_path = Path(local_dir) / filename
 
     log.info(f"Downloading {filename}...")
-    with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as resp:
-        local_path.write_bytes(resp.read())
+    # Stream to disk in chunks — a multi-MB log (or 2.8 MB BMP) never has to
+    # sit in RAM on the Pi all at once. Write to a temp name and rename on
+    # success so a dropped connection can't leave a truncated file where
+    # pending_scp_files() would pick it up.
+    tmp_path = local_path.with_name(local_path.name + ".part")
+    try:
+        with _flashair_get(ip, path, DOWNLOAD_TIMEOUT) as resp, open(tmp_path, "wb") as out:
+            shutil.copyfileobj(resp, out, DOWNLOAD_CHUNK_BYTES)
+        os.replace(tmp_path, local_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
     size_kb = local_path.stat().st_size / 1024
     log.info(f"  Saved {filename} ({size_kb:.0f} KB)")
     return str(local_path)
 
 
+def download_files(
+    ip: str, directory: str, filenames: list[str], local_dir: str,
+) -> list[str]:
+    """Download *filenames* concurrently. Returns local paths of the leading
+    run of files that succeeded, in filename order; failures are logged.
+
+    The link is latency-bound (WiFi RTT + SD seek), not CPU-bound, and the
+    card serves a handful of GETs at once — so a few workers sharing the
+    pooled keep-alive connections hide most of the per-file round trips.
+    Status: `current_file` shows the most recently started download and
+    `files_done` ticks as each one lands.
+
+    Workers finish out of order, so a newer file can land after an older one
+    has failed (link dropped mid-transfer). LAST_SYNCED and LAST_SCPD are
+    filename watermarks, so anything past the first failure is dropped and
+    its local copy removed — otherwise the watermarks would move beyond the
+    missing file and it would never be fetched or sent. Downloads not yet
+    started when a failure comes in are cancelled for the same reason.
+    """
+    def _fetch(fname: str) -> str:
+        _status_set_transferring(fname)
+        return download_file(ip, directory, fname, local_dir)
+
+    done: dict[str, str] = {}
+    workers = max(1, min(DOWNLOAD_WORKERS, len(filenames)))
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = {ex.submit(_fetch, f): f for f in filenames}
+            for fut in as_completed(futures):
+                if fut.cancelled():
+                    continue
+                fname = futures[fut]
+                try:
+                    done[fname] = fut.result()
+                    _status_inc_files_done()
+                except Exception as e:
+                    log.error(f"Failed to download {fname}: {e}")
+                    for pending in futures:
+                        pending.cancel()
+    finally:
+        _status_clear_transferring()
+
+    kept: list[str] = []
+    for fname in filenames:
+        if fname not in done:
+            break
+        kept.append(done[fname])
+    for fname in filenames[len(kept):]:
+        if fname in done:
+            with contextlib.suppress(OSError):
+                os.unlink(done[fname])
+    return kept
+
+
 # ---------------------------------------------------------------------------
 # Screenshot path (BMPs from FLASHAIR_SHOT_DIR, staged in tmpfs LOCAL_SHOT_DIR)
 # ---------------------------------------------------------------------------
@@ -779,23 +1225,17 @@ def download_file(ip: str, directory: str, filename: str, local_dir: str) -> str
 
 def list_flashair_screenshots(ip: str, directory: str) -> list[str]:
     """List BMP screenshot files on the FlashAir."""
-    url = f"http://{ip}/command.cgi?op=100&DIR={directory}"
-    with urllib.request.urlopen(url, timeout=FLASHAIR_HTTP_TIMEOUT) as resp:
-        content = resp.read().decode("utf-8")
-    return sorted(
-        f for f in _parse_flashair_listing(content)
-        if f.lower().endswith(".bmp")
-    )
+    return sorted(_fetch_flashair_listing(
+        ip, directory, lambda f: f.lower().endswith(".bmp"),
+    ))
 
 
 def load_last_shot_scpd() -> str:
-    return _read_env().get("LAST_SHOT_SCPD", "")
+    return _load_state_value("LAST_SHOT_SCPD")
 
 
 def save_last_shot_scpd(filename: str) -> None:
-    env = _read_env()
-    env["LAST_SHOT_SCPD"] = filename
-    _write_env(env)
+    _save_state_value("LAST_SHOT_SCPD", filename)
     log.info(f"Updated LAST_SHOT_SCPD={filename}")
 
 
@@ -857,7 +1297,9 @@ def download_screenshots(
     return downloaded
 
 
-def scp_screenshots(cfg: Config, local_paths: list[Path]) -> int:
+def scp_screenshots(
+    cfg: Config, local_paths: list[Path], control_path: str = "",
+) -> int:
     """SCP staged BMPs to REMOTE_SHOT_DIR. On each success, advance
     LAST_SHOT_SCPD and delete the local file.
 
@@ -869,13 +1311,7 @@ def scp_screenshots(cfg: Config, local_paths: list[Path]) -> int:
     for path in local_paths:
         fname = path.name
         dest = f"{cfg.remote_user}@{cfg.remote_host}:{cfg.remote_shot_dir}/{fname}"
-        cmd = [
-            "scp",
-            "-i", cfg.ssh_key_path,
-            "-o", "StrictHostKeyChecking=accept-new",
-            "-o", "ConnectTimeout=10",
-            str(path), dest,
-        ]
+        cmd = _scp_cmd(cfg, str(path), dest, control_path)
         log.info(f"SCP {fname} → {cfg.remote_host}:{cfg.remote_shot_dir}/")
         _status_set_transferring(fname)
         try:
@@ -915,39 +1351,51 @@ def collect_new_files(
     """Split files into (new, skipped) based on the watermark.
 
     Any file whose name sorts <= watermark is considered already synced.
+    *remote_files* must be sorted (the listing helpers return it that way),
+    so the split point is a binary search rather than a scan.
     """
-    new = []
-    skipped = []
-    for f in remote_files:
-        if watermark and f <= watermark:
-            skipped.append(f)
-        else:
-            new.append(f)
-    return new, skipped
+    idx = bisect.bisect_right(remote_files, watermark) if watermark else 0
+    return remote_files[idx:], remote_files[:idx]
+
+
+def _local_csv_names(directory: str) -> list[str]:
+    """Return the names of local `log_*_*.csv` files, sorted.
+
+    One os.scandir() pass: names and file types come straight from the
+    directory read. Callers join a path only for the names they act on.
+    """
+    try:
+        with os.scandir(directory) as it:
+            names = [
+                e.name for e in it
+                if e.name.startswith("log_") and e.name.endswith(".csv")
+                and "_" in e.name[4:-4] and e.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    names.sort()
+    return names
 
 
 def cleanup_local(
     directory: str, watermark: str, keep_recent: int = 10
 ) -> int:
     """Delete already-synced local CSVs, keeping the most recent *keep_recent*."""
-    p = Path(directory).resolve()
-    if not p.is_dir():
-        return 0
-
-    all_csvs = sorted(p.glob("log_*_*.csv"), key=lambda f: f.name)
-    protected = {f.name for f in all_csvs[-keep_recent:]}
+    directory = os.path.realpath(directory)
+    names = _local_csv_names(directory)
+    protected = set(names[-keep_recent:])
 
     deleted = 0
-    for f in all_csvs:
-        if f.name <= watermark and f.name not in protected:
-            f.unlink()
-            log.info(f"Cleaned up: {f.name}")
+    for name in names:
+        if name <= watermark and name not in protected:
+            os.unlink(os.path.join(directory, name))
+            log.info(f"Cleaned up: {name}")
             deleted += 1
 
     if deleted:
         log.info(
             f"Deleted {deleted} local CSV(s), "
-            f"kept {min(len(all_csvs), keep_recent)} most recent."
+            f"kept {min(len(names), keep_recent)} most recent."
         )
     return deleted
 
@@ -958,39 +1406,193 @@ def cleanup_local(
 
 def load_last_scpd() -> str:
     """Return the LAST_SCPD watermark (last file successfully SCP'd)."""
-    return _read_env().get("LAST_SCPD", "")
+    return _load_state_value("LAST_SCPD")
 
 
 def save_last_scpd(filename: str) -> None:
-    env = _read_env()
-    env["LAST_SCPD"] = filename
-    _write_env(env)
+    _save_state_value("LAST_SCPD", filename)
     log.info(f"Updated LAST_SCPD={filename}")
 
 
 def pending_scp_files(local_dir: str, scp_watermark: str) -> list[str]:
     """Return local CSV paths that haven't been SCP'd yet (after the SCP watermark)."""
-    p = Path(local_dir).resolve()
-    if not p.is_dir():
-        return []
-    all_csvs = sorted(p.glob("log_*_*.csv"), key=lambda f: f.name)
-    return [str(f) for f in all_csvs if not scp_watermark or f.name > scp_watermark]
+    local_dir = os.path.realpath(local_dir)
+    return [
+        os.path.join(local_dir, name) for name in _local_csv_names(local_dir)
+        if not scp_watermark or name > scp_watermark
+    ]
+
+
+def _ssh_opts(cfg: Config) -> list[str]:
+    """Options shared by every ssh/scp invocation against REMOTE_HOST."""
+    return [
+        "-i", cfg.ssh_key_path,
+        "-o", "StrictHostKeyChecking=accept-new",
+        "-o", "ConnectTimeout=10",
+    ]
+
+
+def _scp_cmd(cfg: Config, src: str, dest: str, control_path: str = "") -> list[str]:
+    """Build an scp command line, riding *control_path*'s master if given.
+
+    The full _ssh_opts() stay on even with a master: a client that attaches
+    to it never touches the key or host-key check, but if the socket has
+    gone (master died, ControlPersist lapsed) scp connects directly and
+    needs the configured SSH_KEY_PATH like any other connection.
+    """
+    opts = _ssh_opts(cfg)
+    if control_path:
+        opts += ["-o", f"ControlPath={control_path}"]
+    return ["scp"] + opts + [src, dest]
+
+
+@contextlib.contextmanager
+def _ssh_master(cfg: Config):
+    """Hold one multiplexed SSH connection open for a batch of SCPs.
+
+    Every scp otherwise does its own TCP connect + key exchange + auth —
+    hundreds of ms per file on a Pi Zero. With an OpenSSH ControlMaster up,
+    each scp rides the existing session instead. Yields the ControlPath to
+    pass to _scp_cmd(), or "" if the master couldn't be started (host down,
+    etc.) — scp then connects on its own with the full options, so per-file
+    errors are still reported exactly as before.
+    """
+    ctl_dir = tempfile.mkdtemp(prefix="flashair-ssh-")
+    control_path = os.path.join(ctl_dir, "master")
+    host = f"{cfg.remote_user}@{cfg.remote_host}"
+    started = False
+    try:
+        # stdio to /dev/null: the backgrounded master would otherwise hold
+        # our capture pipes open and subprocess.run() would never return.
+        try:
+            result = subprocess.run(
+                ["ssh", "-M", "-S", control_path, "-o", "ControlPersist=30"]
+                + _ssh_opts(cfg) + ["-Nf", host],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL, timeout=30,
+            )
+            started = result.returncode == 0
+        except subprocess.TimeoutExpired:
+            pass
+        if not started:
+            log.debug("SSH control master unavailable; SCP will connect per file.")
+        yield control_path if started else ""
+    finally:
+        if started:
+            try:
+                subprocess.run(
+                    ["ssh", "-S", control_path, "-O", "exit", host],
+                    capture_output=True, timeout=10,
+                )
+            except subprocess.TimeoutExpired:
+                log.debug("SSH control master did not exit cleanly.")
+        shutil.rmtree(ctl_dir, ignore_errors=True)
+
+
+def _has_pending_uploads(cfg: Config) -> bool:
+    """True if any CSV or staged BMP is waiting for SCP. Filesystem only."""
+    if pending_scp_files(cfg.local_csv_dir, load_last_scpd()):
+        return True
+    return cfg.screenshots_enabled and bool(pending_scp_shots(cfg.local_shot_dir))
+
+
+def _rsync_files(
+    cfg: Config, local_paths: list[str], control_path: str = "",
+) -> Optional[int]:
+    """Send *local_paths* to REMOTE_DIR in a single rsync session.
+
+    One ssh session and one rsync exchange for the whole batch instead of a
+    full scp per file. Names go in via --files-from, in order; rsync logs
+    each file once it has landed (%b in --out-format forces end-of-transfer
+    logging), which drives the status file and tells us how far a failed
+    batch got. --inplace writes straight into the final name like scp does,
+    so a watcher on REMOTE_DIR sees the same events as before.
+
+    Returns how many leading *local_paths* are confirmed delivered, or None
+    if rsync isn't usable here or on the remote (caller falls back to scp).
+    """
+    src_dir = os.path.dirname(local_paths[0])
+    if any(os.path.dirname(p) != src_dir for p in local_paths):
+        return None
+    names = [os.path.basename(p) for p in local_paths]
+    ssh = ["ssh"] + _ssh_opts(cfg)
+    if control_path:
+        ssh += ["-o", f"ControlPath={control_path}"]
+
+    with tempfile.NamedTemporaryFile("w", prefix="flashair-rsync-") as files_from, \
+            tempfile.TemporaryFile() as errf:
+        files_from.write("".join(n + "\n" for n in names))
+        files_from.flush()
+        cmd = [
+            "rsync", "-t", "--inplace", f"--timeout={RSYNC_IO_TIMEOUT}",
+            f"--files-from={files_from.name}", "--out-format=%i %b %n",
+            "-e", shlex.join(ssh),
+            src_dir + "/", f"{cfg.remote_user}@{cfg.remote_host}:{cfg.remote_dir}/",
+        ]
+        try:
+            proc = subprocess.Popen(
+                cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                stderr=errf, text=True,
+            )
+        except FileNotFoundError:
+            log.debug("rsync not installed; falling back to per-file SCP.")
+            return None
+
+        log.info(f"rsync {len(names)} file(s) → {cfg.remote_host}:{cfg.remote_dir}/")
+        watchdog = threading.Timer(RSYNC_TIMEOUT, proc.kill)
+        watchdog.start()
+        landed: set[str] = set()
+        delivered = 0
+        try:
+            _status_set_transferring(names[0])
+            for line in proc.stdout:
+                # "<f+++++++++ 1234 log_....csv" — item flags, bytes, name
+                parts = line.rstrip("\n").split(" ", 2)
+                if len(parts) < 3 or parts[0][1:2] != "f":
+                    continue
+                landed.add(parts[2])
+                _status_inc_files_done()
+                while delivered < len(names) and names[delivered] in landed:
+                    delivered += 1
+                if delivered < len(names):
+                    _status_set_transferring(names[delivered])
+            returncode = proc.wait()
+        finally:
+            watchdog.cancel()
+            _status_clear_transferring()
+
+        if returncode == 0:
+            # Files already identical on the remote aren't logged; exit 0
+            # still means every listed file is there.
+            return len(names)
+        errf.seek(0)
+        err = errf.read().decode("utf-8", "replace").strip()
+
+    # Nothing landed and rsync never got going: protocol stream error (12 —
+    # e.g. a forced command= or sftp-only account), remote shell couldn't
+    # find rsync (127), or ssh itself failed (255). Plain scp (SFTP on
+    # OpenSSH 9+) may still work there, so let the caller try it.
+    if not landed and returncode in (12, 127, 255):
+        log.warning(
+            f"rsync failed to start (exit {returncode}): {err}; "
+            f"falling back to per-file SCP."
+        )
+        return None
+    if returncode < 0:
+        log.error(f"rsync timed out after {delivered}/{len(names)} file(s)")
+    else:
+        log.error(f"rsync failed (exit {returncode}) after {delivered}/{len(names)} file(s): {err}")
+    return delivered
 
 
-def scp_files(cfg: Config, local_paths: list[str]) -> int:
-    """SCP files to the remote server. Returns the number successfully transferred."""
+def _scp_each(cfg: Config, local_paths: list[str], control_path: str = "") -> int:
+    """SCP files one at a time, stopping at the first failure. Returns how many
+    leading *local_paths* were transferred."""
     transferred = 0
-    last_ok = ""
     for path in local_paths:
         fname = Path(path).name
         dest = f"{cfg.remote_user}@{cfg.remote_host}:{cfg.remote_dir}/{fname}"
-        cmd = [
-            "scp",
-            "-i", cfg.ssh_key_path,
-            "-o", "StrictHostKeyChecking=accept-new",
-            "-o", "ConnectTimeout=10",
-            path, dest,
-        ]
+        cmd = _scp_cmd(cfg, path, dest, control_path)
         log.info(f"SCP {fname} → {cfg.remote_host}:{cfg.remote_dir}/")
         _status_set_transferring(fname)
         try:
@@ -1001,16 +1603,30 @@ def scp_files(cfg: Config, local_paths: list[str]) -> int:
                 break
             if result.returncode == 0:
                 transferred += 1
-                last_ok = fname
                 _status_inc_files_done()
             else:
                 log.error(f"SCP failed for {fname}: {result.stderr.strip()}")
                 break  # Stop on first failure (network likely down)
         finally:
             _status_clear_transferring()
+    return transferred
 
-    if last_ok:
-        save_last_scpd(last_ok)
+
+def scp_files(cfg: Config, local_paths: list[str], control_path: str = "") -> int:
+    """Transfer files to the remote server. Returns the number successfully transferred.
+
+    One rsync session for the whole batch when rsync is available on both
+    ends, else one scp per file. Either way only the leading run of
+    delivered files counts, so LAST_SCPD never moves past a failed file.
+    """
+    if not local_paths:
+        return 0
+    transferred = _rsync_files(cfg, local_paths, control_path)
+    if transferred is None:
+        transferred = _scp_each(cfg, local_paths, control_path)
+
+    if transferred:
+        save_last_scpd(Path(local_paths[transferred - 1]).name)
 
     log.info(f"Transferred {transferred}/{len(local_paths)} file(s) to {cfg.remote_host}")
     return transferred
@@ -1035,6 +1651,20 @@ def run(resync: bool = False, _lock=None, bypass_cooldown: bool = False) -> bool
         lock = _lock
 
     try:
+        # Steady state under cron (every minute, 30-min cooldown): nothing to
+        # fetch and nothing to upload. Decide that from the filesystem alone
+        # and bail before talking to wpa_supplicant. The cost is that
+        # stuck-on-FlashAir / disconnected recovery waits for the cooldown to
+        # lapse — but the daemon's first cycle bypasses cooldown, so it still
+        # recovers at once. refresh=True: one stat of .last_sync per cycle, in
+        # case a cron or manual one-shot run touched it since we last looked.
+        if (
+            _in_cooldown(refresh=True) and not resync and not bypass_cooldown
+            and not _has_pending_uploads(cfg)
+        ):
+            log.debug("In cooldown with nothing pending, skipping cycle.")
+            return False
+
         # Fresh cycle — reset stage + session counters so a stale dashboard
         # doesn't carry over "5 shots queued" from a previous run.
         _status_set_stage("scanning")
@@ -1083,15 +1713,14 @@ def run(resync: bool = False, _lock=None, bypass_cooldown: bool = False) -> bool
                     # re-sample so the dashboard stops painting "no wifi" red while
                     # downloads run.
                     _status_set_ssid(get_current_ssid(iface))
-                    remote_files = list_flashair_files(cfg.flashair_ip, cfg.flashair_dir)
-                    log.info(f"Found {len(remote_files)} CSV(s) on FlashAir.")
-
                     watermark = "" if resync else load_last_synced()
                     previous_watermark = watermark  # captured before any save_last_synced
-                    new_files, skipped = collect_new_files(remote_files, watermark)
-
-                    if skipped:
-                        log.info(f"Skipped {len(skipped)} already-synced file(s).")
+                    # Already-synced names are dropped while parsing the
+                    # listing, so this is just the post-watermark delta.
+                    new_files = list_flashair_files(
+                        cfg.flashair_ip, cfg.flashair_dir, after=watermark,
+                    )
+                    log.info(f"Found {len(new_files)} new CSV(s) on FlashAir.")
 
                     # Walk oldest → newest. Only the most recent CSV on the
                     # SD card can be the actively-written one (avionics
@@ -1153,83 +1782,82 @@ def run(resync: bool = False, _lock=None, bypass_cooldown: bool = False) -> bool
                         deferred_active = False
 
                         # Phase A: download the known-closed older files.
+                        # They can't change under us, so fetch them
+                        # concurrently (see download_files).
                         if older_closed:
                             log.info(
                                 f"Downloading {len(older_closed)} closed file(s)..."
                             )
-                            for fname in older_closed:
-                                _status_set_transferring(fname)
+                            downloaded.extend(download_files(
+                                cfg.flashair_ip, cfg.flashair_dir,
+                                older_closed, cfg.local_csv_dir,
+                            ))
+                            session_downloads += len(downloaded)
+                            if downloaded:
+                                save_last_synced(Path(downloaded[-1]).name)
+
+                        # Phase B: the newest file waits while an older one
+                        # is missing — LAST_SYNCED can't move past the gap.
+                        if len(downloaded) < len(older_closed):
+                            log.info(
+                                f"Skipping {candidate_active} until the older "
+                                f"file(s) are in (will retry next cycle)."
+                            )
+                        else:
+                            # Stability check on the (potentially
+                            # active) newest, then download if stable. The
+                            # try/except converts a connection-drop during the
+                            # 90s poll into a deferral instead of an unhandled
+                            # exception that would skip the rest of the cycle.
+                            #
+                            # Surface a distinct "checking_logs" stage: nothing
+                            # downloads during the 90s poll, so leaving the stage
+                            # on "downloading_logs" made a single-log sync look
+                            # hung on "0 of 1" for the whole check.
+                            _status_set_stage("checking_logs", files_total=1)
+                            try:
+                                stable, _unstable = filter_stable_files(
+                                    cfg.flashair_ip, cfg.flashair_dir,
+                                    [candidate_active],
+                                )
+                            except Exception as e:
+                                log.warning(
+                                    f"Stability check on {candidate_active} "
+                                    f"failed ({e}); deferring to next cycle."
+                                )
+                                stable, _unstable = [], [candidate_active]
+
+                            if _unstable:
+                                log.info(
+                                    f"Deferring actively-written file: "
+                                    f"{_unstable[0]} (will retry next cycle)"
+                                )
+                                deferred_active = True
+                            elif stable:
+                                # Resume the download stage, restoring progress
+                                # from any older_closed files already pulled
+                                # (set_stage above reset files_done to 0).
+                                with _status_lock:
+                                    _status["stage"] = "downloading_logs"
+                                    _status["files_total"] = len(new_files)
+                                    _status["files_done"] = len(downloaded)
+                                _status_set_transferring(candidate_active)
                                 try:
                                     path = download_file(
                                         cfg.flashair_ip, cfg.flashair_dir,
-                                        fname, cfg.local_csv_dir,
+                                        candidate_active, cfg.local_csv_dir,
                                     )
                                     downloaded.append(path)
                                     session_downloads += 1
                                     _status_inc_files_done()
+                                    save_last_synced(candidate_active)
                                 except Exception as e:
-                                    log.error(f"Failed to download {fname}: {e}")
+                                    log.error(
+                                        f"Failed to download "
+                                        f"{candidate_active}: {e}"
+                                    )
                                 finally:
                                     _status_clear_transferring()
-                            if downloaded:
-                                save_last_synced(
-                                    max(Path(p).name for p in downloaded)
-                                )
-
-                        # Phase B: stability check on the (potentially
-                        # active) newest, then download if stable. The
-                        # try/except converts a connection-drop during the
-                        # 90s poll into a deferral instead of an unhandled
-                        # exception that would skip the rest of the cycle.
-                        #
-                        # Surface a distinct "checking_logs" stage: nothing
-                        # downloads during the 90s poll, so leaving the stage
-                        # on "downloading_logs" made a single-log sync look
-                        # hung on "0 of 1" for the whole check.
-                        _status_set_stage("checking_logs", files_total=1)
-                        try:
-                            stable, _unstable = filter_stable_files(
-                                cfg.flashair_ip, cfg.flashair_dir,
-                                [candidate_active],
-                            )
-                        except Exception as e:
-                            log.warning(
-                                f"Stability check on {candidate_active} "
-                                f"failed ({e}); deferring to next cycle."
-                            )
-                            stable, _unstable = [], [candidate_active]
-
-                        if _unstable:
-                            log.info(
-                                f"Deferring actively-written file: "
-                                f"{_unstable[0]} (will retry next cycle)"
-                            )
-                            deferred_active = True
-                        elif stable:
-                            # Resume the download stage, restoring progress
-                            # from any older_closed files already pulled
-                            # (set_stage above reset files_done to 0).
-                            with _status_lock:
-                                _status["stage"] = "downloading_logs"
-                                _status["files_total"] = len(new_files)
-                                _status["files_done"] = len(downloaded)
-                            _status_set_transferring(candidate_active)
-                            try:
-                                path = download_file(
-                                    cfg.flashair_ip, cfg.flashair_dir,
-                                    candidate_active, cfg.local_csv_dir,
-                                )
-                                downloaded.append(path)
-                                session_downloads += 1
-                                _status_inc_files_done()
-                                save_last_synced(candidate_active)
-                            except Exception as e:
-                                log.error(
-                                    f"Failed to download "
-                                    f"{candidate_active}: {e}"
-                                )
-                            finally:
-                                _status_clear_transferring()
 
                         # Cooldown: set when we got everything we could
                         # this cycle. A deferred active file is expected
@@ -1324,34 +1952,42 @@ def run(resync: bool = False, _lock=None, bypass_cooldown: bool = False) -> bool
         did_work = False
         scp_ok = True
         transferred = 0
-        to_scp = pending_scp_files(cfg.local_csv_dir, load_last_scpd())
-        if to_scp:
-            did_work = True
-            log.info(f"{len(to_scp)} file(s) pending SCP.")
-            _status_set_stage("uploading_logs", files_total=len(to_scp))
-            transferred = scp_files(cfg, to_scp)
-            scp_ok = (transferred == len(to_scp))
-        else:
-            log.debug("No files pending SCP.")
-
-        # --- Phase 2b: SCP pending screenshots (opt-in) ---
         shots_ok = True
         shots_transferred = 0
+        to_scp = pending_scp_files(cfg.local_csv_dir, load_last_scpd())
         pending_shots: list[Path] = []
         if cfg.screenshots_enabled:
             pending_shots = pending_scp_shots(cfg.local_shot_dir)
+
+        # One multiplexed SSH session for every SCP in Phases 2 and 2b.
+        master = (
+            _ssh_master(cfg) if (to_scp or pending_shots)
+            else contextlib.nullcontext("")
+        )
+        with master as control_path:
+            if to_scp:
+                did_work = True
+                log.info(f"{len(to_scp)} file(s) pending SCP.")
+                _status_set_stage("uploading_logs", files_total=len(to_scp))
+                transferred = scp_files(cfg, to_scp, control_path)
+                scp_ok = (transferred == len(to_scp))
+            else:
+                log.debug("No files pending SCP.")
+
+            # --- Phase 2b: SCP pending screenshots (opt-in) ---
             if pending_shots:
                 did_work = True
                 log.info(f"{len(pending_shots)} BMP(s) pending SCP.")
                 _status_set_stage("uploading_shots", files_total=len(pending_shots))
-                shots_transferred = scp_screenshots(cfg, pending_shots)
+                shots_transferred = scp_screenshots(cfg, pending_shots, control_path)
                 shots_ok = (shots_transferred == len(pending_shots))
-            # Even when nothing was pending right now, a download cycle that
-            # processed shots in Phase 1b counts as a completed shot sync.
-            if shots_transferred or session_shot_downloads:
-                _status_record_shot_sync(
-                    shots_transferred or session_shot_downloads,
-                )
+
+        # Even when nothing was pending right now, a download cycle that
+        # processed shots in Phase 1b counts as a completed shot sync.
+        if cfg.screenshots_enabled and (shots_transferred or session_shot_downloads):
+            _status_record_shot_sync(
+                shots_transferred or session_shot_downloads,
+            )
 
         # --- Phase 3: Cleanup old local files ---
         wm = load_last_synced()
@@ -1377,6 +2013,7 @@ def run(resync: bool = False, _lock=None, bypass_cooldown: bool = False) -> bool
         # On the next cycle's first call, _status_set_stage("scanning")
         # immediately takes over.
         _status_set_stage("idle")
+        _wpa_close()
         if own_lock:
             release_lock(lock)
 